@@ -5,17 +5,32 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import DOMAIN
+from .coordinator import LunarCalendarCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN = "vietnamese_lunar_calendar"
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Vietnamese Lunar Calendar from a config entry."""
+    coordinator = LunarCalendarCoordinator(hass, entry)
+    await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(
+        async_track_time_change(
+            hass,
+            coordinator.async_refresh_at_midnight,
+            hour=0,
+            minute=0,
+            second=0,
+        )
+    )
+
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
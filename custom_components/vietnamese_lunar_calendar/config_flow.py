@@ -9,7 +9,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
-DOMAIN = "vietnamese_lunar_calendar"
+from .const import DOMAIN
 
 
 class VietnameseLunarCalendarConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -0,0 +1,3 @@
+"""Constants for Vietnamese Lunar Calendar."""
+
+DOMAIN = "vietnamese_lunar_calendar"
@@ -0,0 +1,121 @@
+"""Data update coordinator for Vietnamese Lunar Calendar."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN
+from .lunar_solar import (
+    solar_to_lunar,
+    get_next_new_moon_day,
+    julian_day_from_date,
+    zodiac_year,
+    zodiac_day,
+    zodiac_month,
+    day_in_week,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+VN_TIMEZONE = timezone(timedelta(hours=7))
+
+
+@dataclass(frozen=True, slots=True)
+class LunarCalendarData:
+    """Lunar calendar values shown by the sensors for one day."""
+
+    solar_date: date
+    lunar_day: int
+    lunar_month: int
+    lunar_year: int
+    is_leap_month: bool
+    zodiac_year: str
+    zodiac_day: str
+    zodiac_month: str
+    day_of_week: str
+    next_first: date
+    next_first_lunar_month: int
+    next_first_lunar_year: int
+    next_first_is_leap_month: bool
+    next_fifteenth: date
+    next_fifteenth_lunar_month: int
+    next_fifteenth_lunar_year: int
+    next_fifteenth_is_leap_month: bool
+
+
+def _compute_all(today: date) -> LunarCalendarData:
+    """Compute every value shown by the sensors for the given day."""
+    lunar_day, lunar_month, lunar_year, is_leap = solar_to_lunar(
+        today.day, today.month, today.year
+    )
+
+    # The next 1st is the next new moon; the next 15th is in this lunar
+    # month unless it has already passed
+    day_number = julian_day_from_date(today.day, today.month, today.year)
+    next_first_day = get_next_new_moon_day(day_number)
+    next_first = today + timedelta(days=next_first_day - day_number)
+    _, next_first_month, next_first_year, next_first_leap = solar_to_lunar(
+        next_first.day, next_first.month, next_first.year
+    )
+    if lunar_day < 15:
+        next_fifteenth = today + timedelta(days=15 - lunar_day)
+        next_fifteenth_month = lunar_month
+        next_fifteenth_year = lunar_year
+        next_fifteenth_leap = is_leap
+    else:
+        next_fifteenth = next_first + timedelta(days=14)
+        next_fifteenth_month = next_first_month
+        next_fifteenth_year = next_first_year
+        next_fifteenth_leap = next_first_leap
+
+    return LunarCalendarData(
+        solar_date=today,
+        lunar_day=lunar_day,
+        lunar_month=lunar_month,
+        lunar_year=lunar_year,
+        is_leap_month=is_leap == 1,
+        zodiac_year=zodiac_year(lunar_year),
+        zodiac_day=zodiac_day(today.day, today.month, today.year),
+        zodiac_month=zodiac_month(lunar_month, lunar_year),
+        day_of_week=day_in_week(today.day, today.month, today.year),
+        next_first=next_first,
+        next_first_lunar_month=next_first_month,
+        next_first_lunar_year=next_first_year,
+        next_first_is_leap_month=next_first_leap == 1,
+        next_fifteenth=next_fifteenth,
+        next_fifteenth_lunar_month=next_fifteenth_month,
+        next_fifteenth_lunar_year=next_fifteenth_year,
+        next_fifteenth_is_leap_month=next_fifteenth_leap == 1,
+    )
+
+
+class LunarCalendarCoordinator(DataUpdateCoordinator[LunarCalendarData]):
+    """Compute the lunar calendar once a day for all sensors."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        # Refreshed by the midnight timer instead of a fixed interval
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=None,
+        )
+
+    async def _async_update_data(self) -> LunarCalendarData:
+        """Compute the lunar calendar data for today."""
+        today = datetime.now(VN_TIMEZONE).date()
+        # Extra refreshes on the same day reuse the data already computed
+        if self.data is not None and self.data.solar_date == today:
+            return self.data
+        return _compute_all(today)
+
+    async def async_refresh_at_midnight(self, now=None) -> None:
+        """Refresh at midnight."""
+        await self.async_refresh()
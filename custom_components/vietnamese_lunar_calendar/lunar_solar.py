@@ -4,14 +4,55 @@ Based on the book "Astronomical Algorithms" by Jean Meeus, 1998
 Adapted from https://github.com/quangvinh86/SolarLunarCalendar
 """
 
+from bisect import bisect_right
+from functools import lru_cache
 import math
 
-CAN = ["Giáp", "Ất", "Bính", "Đinh", "Mậu", "Kỷ",
-       "Canh", "Tân", "Nhâm", "Quý"]
-CHI = ["Tí", "Sửu", "Dần", "Mão", "Thìn", "Tị", "Ngọ",
-       "Mùi", "Thân", "Dậu", "Tuất", "Hợi"]
-CHI_MONTH = ["", "Dần", "Mão", "Thìn", "Tị", "Ngọ", "Mùi",
-             "Thân", "Dậu", "Tuất", "Hợi", "Tí", "Sửu"]
+CAN = ("Giáp", "Ất", "Bính", "Đinh", "Mậu", "Kỷ",
+       "Canh", "Tân", "Nhâm", "Quý")
+CHI = ("Tí", "Sửu", "Dần", "Mão", "Thìn", "Tị", "Ngọ",
+       "Mùi", "Thân", "Dậu", "Tuất", "Hợi")
+CHI_MONTH = ("", "Dần", "Mão", "Thìn", "Tị", "Ngọ", "Mùi",
+             "Thân", "Dậu", "Tuất", "Hợi", "Tí", "Sửu")
+
+# CAN-CHI names repeat every lcm(10, 12) = 60 years, (year * 12 + month)
+# months and Julian days, so each one is precomputed for a single cycle.
+_YEAR_ZODIAC = tuple("{} {}".format(CAN[(i + 6) % 10], CHI[(i + 8) % 12])
+                     for i in range(60))
+_MONTH_ZODIAC = tuple("{} {}".format(CAN[(i + 3) % 10], CHI[(i + 1) % 12])
+                      for i in range(60))
+_DAY_ZODIAC = tuple("{} {}".format(CAN[(i + 9) % 10], CHI[(i + 1) % 12])
+                    for i in range(60))
+assert all(CHI[(month + 1) % 12] == CHI_MONTH[month] for month in range(1, 13))
+
+_DAY_IN_WEEK_VI = ("Thứ 2", "Thứ 3", "Thứ 4", "Thứ 5",
+                   "Thứ 6", "Thứ 7", "Chủ nhật")
+_DAY_IN_WEEK_EN = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_WEEKDAY_MONTH_OFFSET = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+
+_DEGREE_TO_RADIAN = math.pi / 180
+
+# Polynomial coefficients of the angles in new_moon and sun_longitude,
+# converted from degrees to radians once at import.
+_NEW_MOON_CORRECTION_0 = 166.56 * _DEGREE_TO_RADIAN
+_NEW_MOON_CORRECTION_1 = 132.87 * _DEGREE_TO_RADIAN
+_NEW_MOON_CORRECTION_2 = 0.009173 * _DEGREE_TO_RADIAN
+_MEAN_NEW_MOON_0 = 359.2242 * _DEGREE_TO_RADIAN
+_MEAN_NEW_MOON_1 = 29.10535608 * _DEGREE_TO_RADIAN
+_MEAN_NEW_MOON_2 = 0.0000333 * _DEGREE_TO_RADIAN
+_MEAN_NEW_MOON_3 = 0.00000347 * _DEGREE_TO_RADIAN
+_SUN_MEAN_ANOMALY_0 = 306.0253 * _DEGREE_TO_RADIAN
+_SUN_MEAN_ANOMALY_1 = 385.81691806 * _DEGREE_TO_RADIAN
+_SUN_MEAN_ANOMALY_2 = 0.0107306 * _DEGREE_TO_RADIAN
+_SUN_MEAN_ANOMALY_3 = 0.00001236 * _DEGREE_TO_RADIAN
+_MOON_MEAN_ANOMALY_0 = 21.2964 * _DEGREE_TO_RADIAN
+_MOON_MEAN_ANOMALY_1 = 390.67050646 * _DEGREE_TO_RADIAN
+_MOON_MEAN_ANOMALY_2 = 0.0016528 * _DEGREE_TO_RADIAN
+_MOON_MEAN_ANOMALY_3 = 0.00000239 * _DEGREE_TO_RADIAN
+_SUN_MEAN_TIME_0 = 357.52910 * _DEGREE_TO_RADIAN
+_SUN_MEAN_TIME_1 = 35999.05030 * _DEGREE_TO_RADIAN
+_SUN_MEAN_TIME_2 = 0.0001559 * _DEGREE_TO_RADIAN
+_SUN_MEAN_TIME_3 = 0.00000048 * _DEGREE_TO_RADIAN
 
 
 def julian_day_from_date(dd: int, mm: int, yy: int) -> int:
@@ -19,88 +60,76 @@ def julian_day_from_date(dd: int, mm: int, yy: int) -> int:
     Compute the (integral) Julian day number of day dd/mm/yyyy,
     i.e., the number of days between 1/1/4713 BC (Julian calendar) and dd/mm/yyyy.
     """
-    temp_a = int((14 - mm) / 12.)
+    temp_a = (14 - mm) // 12
     temp_year = yy + 4800 - temp_a
     temp_month = mm + 12 * temp_a - 3
-    julian_day = (dd + int((153*temp_month + 2) / 5.) +
-                  365 * temp_year + int(temp_year / 4.) -
-                  int(temp_year/100.) + int(temp_year/400)
+    julian_day = (dd + (153*temp_month + 2) // 5 +
+                  365 * temp_year + temp_year // 4 -
+                  temp_year // 100 + temp_year // 400
                   - 32045)
     if julian_day < 2299161:
-        julian_day = dd + int((153*temp_month + 2)/5.) \
-            + 365*temp_year + int(temp_year/4.) - 32083
+        julian_day = dd + (153*temp_month + 2) // 5 \
+            + 365*temp_year + temp_year // 4 - 32083
     return julian_day
 
 
-def julian_day_to_date(julian_day: int) -> list:
+def julian_day_to_date(julian_day: int) -> list[int]:
     """Convert a Julian day number to day/month/year."""
     if julian_day > 2299160:
         temp_a = julian_day + 32044
-        temp_b = int((4 * temp_a + 3) / 146097.)
-        temp_c = temp_a - int((temp_b * 146097) / 4.)
+        temp_b = (4 * temp_a + 3) // 146097
+        temp_c = temp_a - (temp_b * 146097) // 4
     else:
         temp_b = 0
         temp_c = julian_day + 32082
-    temp_d = int((4 * temp_c + 3) / 1461.)
-    temp_e = temp_c - int((1461 * temp_d) / 4.)
-    temp_m = int((5 * temp_e + 2) / 153.)
-    _day = temp_e - int((153 * temp_m + 2) / 5.) + 1
-    _month = temp_m + 3 - 12 * int(temp_m / 10.)
-    _year = temp_b * 100 + temp_d - 4800 + int(temp_m / 10.)
+    temp_d = (4 * temp_c + 3) // 1461
+    temp_e = temp_c - (1461 * temp_d) // 4
+    temp_m = (5 * temp_e + 2) // 153
+    _day = temp_e - (153 * temp_m + 2) // 5 + 1
+    _month = temp_m + 3 - 12 * (temp_m // 10)
+    _year = temp_b * 100 + temp_d - 4800 + temp_m // 10
     return [_day, _month, _year]
 
 
+@lru_cache(maxsize=512)
 def new_moon(k_th: float) -> float:
     """
     Compute the time of the k-th new moon after the new moon
     of 1/1/1900 13:52 UCT.
     """
+    sin = math.sin
     time_julian = k_th / 1236.85
     time_julian_2 = time_julian * time_julian
     time_julian_3 = time_julian_2 * time_julian
-    degree_to_radian = math.pi / 180
     julian_day_1 = (2415020.75933 + 29.53058868 * k_th +
                     0.0001178 * time_julian_2 -
                     0.000000155 * time_julian_3)
     julian_day_1 = (julian_day_1 +
-                    0.00033*math.sin((166.56 + 132.87*time_julian -
-                                      0.009173 * time_julian_2) *
-                                     degree_to_radian))
-    mean_new_moon = (359.2242 + 29.10535608*k_th -
-                     0.0000333*time_julian_2 - 0.00000347*time_julian_3)
-    sun_mean_anomaly = (306.0253 + 385.81691806*k_th +
-                        0.0107306*time_julian_2 + 0.00001236*time_julian_3)
-    moon_mean_anomaly = (21.2964 + 390.67050646*k_th -
-                         0.0016528*time_julian_2 - 0.00000239*time_julian_3)
-    moon_arg_lat = ((0.1734 - 0.000393*time_julian) *
-                    math.sin(mean_new_moon*degree_to_radian) +
-                    0.0021*math.sin(2*degree_to_radian*mean_new_moon))
-    moon_arg_lat = (moon_arg_lat -
-                    0.4068*math.sin(sun_mean_anomaly*degree_to_radian)
-                    + 0.0161*math.sin(degree_to_radian*2*sun_mean_anomaly))
-    moon_arg_lat = (moon_arg_lat -
-                    0.0004*math.sin(degree_to_radian*3*sun_mean_anomaly))
-    moon_arg_lat = (moon_arg_lat +
-                    0.0104*math.sin(degree_to_radian*2*moon_mean_anomaly)
-                    - 0.0051 * math.sin(degree_to_radian *
-                                        (mean_new_moon + sun_mean_anomaly)))
-    moon_arg_lat = (moon_arg_lat -
-                    0.0074*math.sin(degree_to_radian *
-                                    (mean_new_moon - sun_mean_anomaly))
-                    + 0.0004*math.sin(degree_to_radian *
-                                      (2*moon_mean_anomaly + mean_new_moon)))
-    moon_arg_lat = (moon_arg_lat - 0.0004*math.sin(degree_to_radian *
-                                                   (2*moon_mean_anomaly -
-                                                    mean_new_moon))
-                    - 0.0006 * math.sin(degree_to_radian *
-                                        (2*moon_mean_anomaly
-                                         + sun_mean_anomaly)))
-    moon_arg_lat = (moon_arg_lat + 0.0010*math.sin(degree_to_radian *
-                                                   (2*moon_mean_anomaly -
-                                                    sun_mean_anomaly))
-                    + 0.0005*math.sin(degree_to_radian *
-                                      (2*sun_mean_anomaly + mean_new_moon))
-                    )
+                    0.00033*sin(_NEW_MOON_CORRECTION_0 +
+                                _NEW_MOON_CORRECTION_1*time_julian -
+                                _NEW_MOON_CORRECTION_2*time_julian_2))
+    mean_new_moon = (_MEAN_NEW_MOON_0 + _MEAN_NEW_MOON_1*k_th -
+                     _MEAN_NEW_MOON_2*time_julian_2 -
+                     _MEAN_NEW_MOON_3*time_julian_3)
+    sun_mean_anomaly = (_SUN_MEAN_ANOMALY_0 + _SUN_MEAN_ANOMALY_1*k_th +
+                        _SUN_MEAN_ANOMALY_2*time_julian_2 +
+                        _SUN_MEAN_ANOMALY_3*time_julian_3)
+    moon_mean_anomaly = (_MOON_MEAN_ANOMALY_0 + _MOON_MEAN_ANOMALY_1*k_th -
+                         _MOON_MEAN_ANOMALY_2*time_julian_2 -
+                         _MOON_MEAN_ANOMALY_3*time_julian_3)
+    moon_arg_lat = ((0.1734 - 0.000393*time_julian) * sin(mean_new_moon)
+                    + 0.0021*sin(2*mean_new_moon))
+    moon_arg_lat = (moon_arg_lat - 0.4068*sin(sun_mean_anomaly)
+                    + 0.0161*sin(2*sun_mean_anomaly))
+    moon_arg_lat = moon_arg_lat - 0.0004*sin(3*sun_mean_anomaly)
+    moon_arg_lat = (moon_arg_lat + 0.0104*sin(2*moon_mean_anomaly)
+                    - 0.0051*sin(mean_new_moon + sun_mean_anomaly))
+    moon_arg_lat = (moon_arg_lat - 0.0074*sin(mean_new_moon - sun_mean_anomaly)
+                    + 0.0004*sin(2*moon_mean_anomaly + mean_new_moon))
+    moon_arg_lat = (moon_arg_lat - 0.0004*sin(2*moon_mean_anomaly - mean_new_moon)
+                    - 0.0006*sin(2*moon_mean_anomaly + sun_mean_anomaly))
+    moon_arg_lat = (moon_arg_lat + 0.0010*sin(2*moon_mean_anomaly - sun_mean_anomaly)
+                    + 0.0005*sin(2*sun_mean_anomaly + mean_new_moon))
     if time_julian < -11:
         deltat = (0.001 + 0.000839*time_julian + 0.0002261*time_julian_2
                   - 0.00000845*time_julian_3 -
@@ -113,67 +142,105 @@ def new_moon(k_th: float) -> float:
 
 def sun_longitude(jdn: float) -> float:
     """Compute the longitude of the sun at any time."""
+    sin = math.sin
     time_in_julian = (jdn - 2451545.0) / 36525.
     time_in_julian_2 = time_in_julian * time_in_julian
-    degree_to_radian = math.pi / 180.
-    mean_time = (357.52910 + 35999.05030*time_in_julian
-                 - 0.0001559*time_in_julian_2 -
-                 0.00000048 * time_in_julian*time_in_julian_2)
+    mean_time = (_SUN_MEAN_TIME_0 + _SUN_MEAN_TIME_1*time_in_julian
+                 - _SUN_MEAN_TIME_2*time_in_julian_2 -
+                 _SUN_MEAN_TIME_3*time_in_julian*time_in_julian_2)
     mean_degree = (280.46645 + 36000.76983*time_in_julian +
                    0.0003032*time_in_julian_2)
     mean_long_degree = ((1.914600 - 0.004817*time_in_julian -
-                         0.000014*time_in_julian_2)
-                        * math.sin(degree_to_radian*mean_time))
+                         0.000014*time_in_julian_2) * sin(mean_time))
     mean_long_degree += ((0.019993 - 0.000101*time_in_julian) *
-                         math.sin(degree_to_radian*2*mean_time) +
-                         0.000290*math.sin(degree_to_radian*3*mean_time))
+                         sin(2*mean_time) + 0.000290*sin(3*mean_time))
     long_degree = mean_degree + mean_long_degree
-    long_degree = long_degree * degree_to_radian
-    long_degree = long_degree - math.pi*2*(int(long_degree / (math.pi*2)))
+    long_degree = long_degree * _DEGREE_TO_RADIAN
+    long_degree = math.fmod(long_degree, math.pi*2)
     return long_degree
 
 
+@lru_cache(maxsize=512)
 def get_sun_longitude(day_number: int, time_zone: float) -> int:
     """Compute sun position at midnight of the day."""
     return int(sun_longitude(day_number - 0.5 - time_zone / 24)
                / math.pi*6)
 
 
+def _compute_new_moon_day(k: int, time_zone: float) -> int:
+    """Compute the day of the k-th new moon from the trigonometric series."""
+    return int(new_moon(k) + 0.5 + time_zone / 24.)
+
+
+# New moon days (and the sun longitude sector at each of them) for the
+# default UTC+7 time zone, covering the years 1900-2100.
+_TABLE_TIME_ZONE = 7
+_TABLE_K_MIN = 0
+_TABLE_K_MAX = 2475
+_NEW_MOON_DAYS = tuple(_compute_new_moon_day(k, _TABLE_TIME_ZONE)
+                       for k in range(_TABLE_K_MIN, _TABLE_K_MAX))
+_NEW_MOON_ARCS = tuple(get_sun_longitude(day, _TABLE_TIME_ZONE)
+                       for day in _NEW_MOON_DAYS)
+
+
 def get_new_moon_day(k: int, time_zone: float) -> int:
     """Compute the day of the k-th new moon in the given time zone."""
-    return int(new_moon(k) + 0.5 + time_zone / 24.)
+    if time_zone == _TABLE_TIME_ZONE and _TABLE_K_MIN <= k < _TABLE_K_MAX:
+        return _NEW_MOON_DAYS[k - _TABLE_K_MIN]
+    return _compute_new_moon_day(k, time_zone)
+
+
+def _get_new_moon_arc(k: int, time_zone: float) -> int:
+    """Compute sun position at midnight of the day of the k-th new moon."""
+    if time_zone == _TABLE_TIME_ZONE and _TABLE_K_MIN <= k < _TABLE_K_MAX:
+        return _NEW_MOON_ARCS[k - _TABLE_K_MIN]
+    return get_sun_longitude(get_new_moon_day(k, time_zone), time_zone)
+
+
+def get_next_new_moon_day(day_number: int, time_zone: float = 7) -> int:
+    """Find the first day after the given Julian day that starts a lunar month."""
+    if (time_zone == _TABLE_TIME_ZONE
+            and _NEW_MOON_DAYS[0] <= day_number < _NEW_MOON_DAYS[-1]):
+        return _NEW_MOON_DAYS[bisect_right(_NEW_MOON_DAYS, day_number)]
+    # Start one month early so the estimate never overshoots the answer
+    k = math.floor((day_number - 2415021.076998695) / 29.530588853) - 1
+    month_start = get_new_moon_day(k, time_zone)
+    while month_start <= day_number:
+        k += 1
+        month_start = get_new_moon_day(k, time_zone)
+    return month_start
 
 
+@lru_cache(maxsize=512)
 def get_lunar_month_11(yy: int, time_zone: float) -> int:
     """Find the day that starts the lunar month 11 of the given year."""
     off = julian_day_from_date(31, 12, yy) - 2415021.
     k = int(off / 29.530588853)
-    lunar_month = get_new_moon_day(k, time_zone)
-    sun_long = get_sun_longitude(lunar_month, time_zone)
-    if sun_long >= 9:
-        lunar_month = get_new_moon_day(k - 1, time_zone)
-    return lunar_month
+    if _get_new_moon_arc(k, time_zone) >= 9:
+        k -= 1
+    return get_new_moon_day(k, time_zone)
 
 
 def get_leap_month_offset(a11: int, time_zone: float) -> int:
     """Find the index of the leap month after the month starting on the day a11."""
     k = int((a11 - 2415021.076998695) / 29.530588853 + 0.5)
-    last = 0
-    i = 1
-    arc = get_sun_longitude(get_new_moon_day(k + i, time_zone), time_zone)
-    while True:
+    last = _get_new_moon_arc(k + 1, time_zone)
+    for i in range(1, 14):
+        arc = _get_new_moon_arc(k + i + 1, time_zone)
+        if arc == last:
+            return i
         last = arc
-        i += 1
-        arc = get_sun_longitude(get_new_moon_day(k + i, time_zone), time_zone)
-        if not (arc != last and i < 14):
-            break
-    return i - 1
+    return 13
 
 
-def solar_to_lunar(solar_dd: int, solar_mm: int, solar_yy: int, time_zone: float = 7) -> list:
+@lru_cache(maxsize=512)
+def solar_to_lunar(solar_dd: int, solar_mm: int, solar_yy: int,
+                   time_zone: float = 7) -> tuple[int, int, int, int]:
     """
     Convert solar date dd/mm/yyyy to the corresponding lunar date.
-    Returns: [day, month, year, is_leap_month]
+    Returns: (day, month, year, is_leap_month)
+
+    Results are memoized, so the returned tuple is shared between callers.
     """
     day_number = julian_day_from_date(solar_dd, solar_mm, solar_yy)
     k = int((day_number - 2415021.076998695) / 29.530588853)
@@ -202,24 +269,37 @@ def solar_to_lunar(solar_dd: int, solar_mm: int, solar_yy: int, time_zone: float
         lunar_month = lunar_month - 12
     if lunar_month >= 11 and diff < 4:
         lunar_year -= 1
-    return [lunar_day, lunar_month, lunar_year, lunar_leap]
+    return (lunar_day, lunar_month, lunar_year, lunar_leap)
+
+
+@lru_cache(maxsize=32)
+def _get_lunar_year_table(yy: int, time_zone: float) -> tuple[int, tuple[int, ...]]:
+    """
+    Find the leap month offset (0 if there is no leap month) and the start
+    days of the 13 lunar months from the lunar month 11 of the given year.
+    """
+    a11 = get_lunar_month_11(yy, time_zone)
+    b11 = get_lunar_month_11(yy + 1, time_zone)
+    k = int(0.5 + (a11 - 2415021.076998695) / 29.530588853)
+    leap_off = 0
+    if b11 - a11 > 365:
+        leap_off = get_leap_month_offset(a11, time_zone)
+    month_starts = tuple(get_new_moon_day(k + i, time_zone) for i in range(13))
+    return leap_off, month_starts
 
 
 def lunar_to_solar(lunar_day: int, lunar_month: int, lunar_year: int,
-                   lunar_leap_month: int, time_zone: float = 7) -> list:
+                   lunar_leap_month: int, time_zone: float = 7) -> list[int]:
     """Convert a lunar date to the corresponding solar date."""
     if lunar_month < 11:
-        a11 = get_lunar_month_11(lunar_year - 1, time_zone)
-        b11 = get_lunar_month_11(lunar_year, time_zone)
+        table_year = lunar_year - 1
     else:
-        a11 = get_lunar_month_11(lunar_year, time_zone)
-        b11 = get_lunar_month_11(lunar_year + 1, time_zone)
-    k = int(0.5 + (a11 - 2415021.076998695) / 29.530588853)
+        table_year = lunar_year
+    leap_off, month_starts = _get_lunar_year_table(table_year, time_zone)
     off = lunar_month - 11
     if off < 0:
         off += 12
-    if b11 - a11 > 365:
-        leap_off = get_leap_month_offset(a11, time_zone)
+    if leap_off:
         leap_month = leap_off - 2
         if leap_month < 0:
             leap_month += 12
@@ -227,39 +307,37 @@ def lunar_to_solar(lunar_day: int, lunar_month: int, lunar_year: int,
             return [0, 0, 0]
         elif lunar_leap_month != 0 or off >= leap_off:
             off += 1
-    month_start = get_new_moon_day(k + off, time_zone)
-    return julian_day_to_date(month_start + lunar_day - 1)
+    return julian_day_to_date(month_starts[off] + lunar_day - 1)
 
 
 def day_in_week(solar_dd: int, solar_mm: int, solar_yy: int, viet_language: int = 1) -> str:
     """Get day in week."""
-    julian_day = julian_day_from_date(solar_dd, solar_mm, solar_yy)
-    date_index = julian_day % 7
-    if viet_language:
-        _day_in_week = ["Thứ 2", "Thứ 3", "Thứ 4", "Thứ 5",
-                        "Thứ 6", "Thứ 7", "Chủ nhật"]
+    if (solar_yy, solar_mm, solar_dd) < (1582, 10, 15):
+        # Dates before the Gregorian reform follow the Julian calendar.
+        date_index = julian_day_from_date(solar_dd, solar_mm, solar_yy) % 7
     else:
-        _day_in_week = ["Mon", "Tue", "Wed", "Thu",
-                        "Fri", "Sat", "Sun"]
-    return _day_in_week[date_index]
+        # Sakamoto's method, shifted so that 0 is Monday.
+        if solar_mm < 3:
+            solar_yy -= 1
+        date_index = (solar_yy + solar_yy // 4 - solar_yy // 100
+                      + solar_yy // 400 + _WEEKDAY_MONTH_OFFSET[solar_mm - 1]
+                      + solar_dd + 6) % 7
+    if viet_language:
+        return _DAY_IN_WEEK_VI[date_index]
+    return _DAY_IN_WEEK_EN[date_index]
 
 
 def zodiac_year(year: int) -> str:
     """Find year in CAN-CHI (zodiac) name."""
-    can_index = (year + 6) % 10
-    chi_index = (year + 8) % 12
-    return "{} {}".format(CAN[can_index], CHI[chi_index])
+    return _YEAR_ZODIAC[year % 60]
 
 
 def zodiac_day(solar_dd: int, solar_mm: int, solar_yy: int) -> str:
     """Find day in CAN-CHI (zodiac) name."""
     julian_day = julian_day_from_date(solar_dd, solar_mm, solar_yy)
-    can_index = (julian_day + 9) % 10
-    chi_index = (julian_day + 1) % 12
-    return "{} {}".format(CAN[can_index], CHI[chi_index])
+    return _DAY_ZODIAC[julian_day % 60]
 
 
 def zodiac_month(month: int, year: int) -> str:
     """Month in CAN-CHI name."""
-    can_index = (year * 12 + month + 3) % 10
-    return "{} {}".format(CAN[can_index], CHI_MONTH[month])
+    return _MONTH_ZODIAC[(year * 12 + month) % 60]